@@ -2,6 +2,7 @@ import os
 import json
 import logging
 import base64
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
@@ -9,6 +10,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 from utils.chatbot import CareerGuidanceCounselor
+from utils.llm_metrics import llm_metrics
+from utils.response_cache import response_cache
+from utils.prompt import CareerGuidancePrompts
 from websocket_manager import manager
 
 
@@ -21,7 +25,19 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
-app = FastAPI(title="AI Career Guidance Platform API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Compile the prompt templates per worker before the first request; log LLM usage at shutdown"""
+    count = CareerGuidancePrompts.precompile()
+    logger.info(f" Precompiled {count} prompt templates")
+    yield
+    # Process-wide usage goes to the operator's logs, not to clients
+    logger.info(f" LLM usage by template: {llm_metrics.snapshot()}")
+    logger.info(f" Response cache: {response_cache.hits} hits, {response_cache.misses} misses")
+
+
+app = FastAPI(title="AI Career Guidance Platform API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
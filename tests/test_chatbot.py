@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+pytest.importorskip("gtts")
+pytest.importorskip("dotenv")
+
+import utils.chatbot as chatbot
+from utils.chatbot import CareerGuidanceCounselor, Turn
+from utils.prompt import LANG_DIRECTIVES, UserIntent
+from utils.response_cache import ResponseCache
+
+
+@pytest.fixture
+def counselor_factory(monkeypatch):
+    """Counselors whose model answers in the language the prompt directs, counting calls"""
+    monkeypatch.setenv("GEMINI_API_KEY", "test")
+    monkeypatch.setattr(chatbot, "response_cache", ResponseCache())
+    calls = []
+
+    async def fake_generate(self, template, prompt, **kwargs):
+        calls.append(self.session_id)
+        text = "".join(prompt)
+        answer = "हिंदी उत्तर" if LANG_DIRECTIVES["hi"] in text else "English answer"
+        return SimpleNamespace(text=answer)
+
+    monkeypatch.setattr(CareerGuidanceCounselor, "_generate", fake_generate)
+
+    def make(session_id):
+        return CareerGuidanceCounselor(session_id)
+
+    make.calls = calls
+    return make
+
+
+def ask(counselor, text, language):
+    counselor.state.current_language = language
+    counselor._append_message(Turn(role="user", content=text, language=language,
+                                   intent=UserIntent.GENERAL_QUESTION))
+    return asyncio.run(counselor._on_general_question(text))[0]
+
+
+def test_cached_answer_keeps_the_language_it_was_generated_for(counselor_factory):
+    hindi_session = counselor_factory("a")
+    english_session = counselor_factory("b")
+    question = "What does a data analyst do?"
+
+    hindi_session._append_message(Turn(role="user", content="नमस्ते", language="hi"))
+    assert ask(hindi_session, question, "en") == "हिंदी उत्तर"
+
+    assert ask(english_session, question, "en") == "English answer"
+    assert counselor_factory.calls == ["a", "b"]
+
+
+def test_cached_answer_is_reused_within_a_language(counselor_factory):
+    first = counselor_factory("a")
+    second = counselor_factory("b")
+
+    assert ask(first, "What does a data analyst do?", "en") == "English answer"
+    assert ask(second, "what does a data analyst do", "en") == "English answer"
+    assert counselor_factory.calls == ["a"]
+
+
+@pytest.mark.parametrize("user_messages, phase, asks_llm", [
+    (1, "discovery", False),
+    (2, "matching", True),
+    (3, "matching", True),
+    (5, "matching", True),
+    (6, "exploration", False),
+    (9, "exploration", False),
+])
+def test_progress_check_only_asks_the_llm_between_the_thresholds(
+        monkeypatch, user_messages, phase, asks_llm):
+    monkeypatch.setenv("GEMINI_API_KEY", "test")
+    calls = []
+
+    async def fake_generate(self, template, prompt, **kwargs):
+        calls.append(template)
+        return SimpleNamespace(text='{"phase": "matching", "ready_for_matching": true}')
+
+    monkeypatch.setattr(CareerGuidanceCounselor, "_generate", fake_generate)
+    counselor = CareerGuidanceCounselor("progress")
+    counselor.state.user_msg_count = user_messages
+
+    progress = asyncio.run(counselor._check_phase_progress())
+
+    assert progress["phase"] == phase
+    assert calls == (["PROGRESS_CHECK_PROMPT"] if asks_llm else [])
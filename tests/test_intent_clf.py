@@ -0,0 +1,41 @@
+import pytest
+
+from utils.intent_clf import intent_classifier
+from utils.prompt import UserIntent
+
+
+# Every phrase here is held out: none is in INTENT_TRIGGERS or INTENT_EXAMPLES
+@pytest.mark.parametrize("message", [
+    "What do you mean?",
+    "goodbye",
+    "Is engineering hard?",
+    "What is data science?",
+    "who are you",
+    "I live in Pune",
+    "I am in class 10",
+    "sounds good",
+    "I play cricket on weekends",
+    "is it hard to get into IIT?",
+    "When does JEE registration start?",
+    "I'm under exam pressure",
+    "we can't afford private college",
+])
+def test_out_of_domain_or_mixed_text_is_left_to_the_llm(message):
+    assert intent_classifier.predict(message) is None
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("hello there", UserIntent.GREETING),
+    ("what job should i pick", UserIntent.CAREER_EXPLORATION),
+    ("please create my career plan", UserIntent.REQUEST_PLAN),
+    ("how much do engineers earn?", UserIntent.SALARY_QUESTION),
+    ("mujhe kuch samajh nahi aa raha", UserIntent.UNCERTAINTY),
+    ("mujhe music pasand hai", UserIntent.INTEREST_SHARING),
+    ("neet ki taiyari kaise karu", UserIntent.EXAM_PREPARATION),
+    ("commerce lun ya science", UserIntent.STREAM_SELECTION),
+    ("thanks a lot", UserIntent.GRATITUDE),
+    ("medical ke alawa kya hai", UserIntent.ALTERNATIVE_OPTIONS),
+])
+def test_held_out_phrases_are_classified(message, intent):
+    prediction = intent_classifier.predict(message)
+    assert prediction is not None and prediction[0] is intent
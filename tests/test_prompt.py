@@ -0,0 +1,50 @@
+import pytest
+
+from utils.prompt import PROMPT_FILES, CareerGuidancePrompts, UserIntent, get_prompt
+
+
+@pytest.mark.parametrize("message", [
+    "When does JEE registration start?",
+    "Can you guide me about engineering fees?",
+    "I'm under exam pressure",
+    "Can you help me understand NEET?",
+    "hi-tech jobs",
+])
+def test_single_word_triggers_inside_a_question_are_left_to_the_classifier(message):
+    assert CareerGuidancePrompts.classify_fast(message) is None
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("hi", UserIntent.GREETING),
+    ("Hello!", UserIntent.GREETING),
+    ("नमस्ते", UserIntent.GREETING),
+    ("thanks", UserIntent.GRATITUDE),
+    ("How are you?", UserIntent.GREETING),
+    ("I don't know what to do", UserIntent.UNCERTAINTY),
+    ("My parents want me to do MBBS", UserIntent.PARENTAL_PRESSURE),
+    ("Mera career plan banao", UserIntent.REQUEST_PLAN),
+])
+def test_whole_message_and_phrase_triggers_are_routed_locally(message, intent):
+    assert CareerGuidancePrompts.classify_fast(message) is intent
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("shukria", UserIntent.GRATITUDE),
+    ("Namastey!", UserIntent.GREETING),
+    ("pakage?", UserIntent.SALARY_QUESTION),
+])
+def test_misspelled_one_word_triggers_are_corrected(message, intent):
+    assert CareerGuidancePrompts.classify_fuzzy(message) is intent
+
+
+@pytest.mark.parametrize("message", [
+    "careen", "carter", "thinks", "learning", "pressured", "What is the pakage for pilots?",
+])
+def test_english_words_and_longer_messages_are_not_corrected(message):
+    assert CareerGuidancePrompts.classify_fuzzy(message) is None
+
+
+def test_template_attributes_load_once_and_then_read_as_plain_text():
+    for name in PROMPT_FILES:
+        assert getattr(CareerGuidancePrompts, name) == get_prompt(name)
+        assert type(vars(CareerGuidancePrompts)[name]) is str
@@ -4,7 +4,10 @@ import asyncio
 import logging
 import re
 import base64
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from itertools import chain, repeat
+from dataclasses import dataclass, field, asdict, fields
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from io import BytesIO
 
@@ -12,7 +15,14 @@ import google.generativeai as genai
 from gtts import gTTS
 from dotenv import load_dotenv
 
-from utils.prompt import CareerGuidancePrompts
+from utils.prompt import (
+    CASUAL_CHAT_SCENARIOS, CONTEXT_LANGUAGE_WINDOW, CONTEXT_WINDOW, INTENT_GENERATION_CONFIG, PROMPT_TOKEN_BUDGET,
+    SUMMARY_MAX_LINES, CareerGuidancePrompts, UserIntent, estimate_tokens, fit_scenarios, get_examples,
+    get_plan_skeleton, get_prompt, match_scenarios, prompt_tokens
+)
+from utils.intent_clf import intent_classifier
+from utils.llm_metrics import llm_metrics
+from utils.response_cache import response_cache
 
 
 logging.basicConfig(level=logging.INFO)
@@ -20,24 +30,95 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 
-class UserIntent:
-    """Intent classification for user inputs"""
-    GREETING = "greeting"
-    CAREER_EXPLORATION = "career_exploration"
-    SKILL_INQUIRY = "skill_inquiry"
-    EDUCATION_QUESTION = "education_question"
-    SALARY_QUESTION = "salary_question"
-    APPLICATION_HELP = "application_help"
-    CLARIFICATION_QUESTION = "clarification_question"
-    UNCERTAINTY = "uncertainty"
-    PARENTAL_PRESSURE = "parental_pressure"
-    COMPARISON_REQUEST = "comparison_request"
-    OFF_TOPIC = "off_topic"
-    GRATITUDE = "gratitude"
-    READY_TO_START = "ready_to_start"
-    REQUEST_EXAMPLES = "request_examples"
-    GENERAL_QUESTION = "general_question"
-    REQUEST_PLAN = "request_plan"
+# Only user message counts in [MIN, READY) reach PROGRESS_CHECK_PROMPT
+PROGRESS_MIN_MESSAGES = 2
+PROGRESS_READY_MESSAGES = 6
+
+# Devanagari block used for Hindi detection
+DEVANAGARI_PATTERN = re.compile(r'[\u0900-\u097F]')
+
+# Common romanized Hindi words used for Hinglish detection, one named group per family
+HINGLISH_PATTERN = re.compile(
+    r'\b(?:'
+    r'(?P<question>kya|kaise|kitna|kitne|kab|kahan|kyun|aur|hai|hain|ho|hoon)'
+    r'|(?P<pronoun>mujhe|mera|mere|apna|apne|tum|aap|yeh|woh|kuch)'
+    r'|(?P<verb>chahiye|rakhna|dena|lena|samajh|batao|bolo)'
+    r'|(?P<quantity>bilkul|bahut|thoda|zyada|sab|koi|kaun)'
+    r'|(?P<courtesy>namaste|shukriya|dhanyavaad|theek|acha|haan|nahi)'
+    r')\b'
+)
+
+
+@dataclass
+class StudentProfile:
+    """Student profile data gathered during the conversation"""
+    grade: Optional[str] = None
+    age_range: Optional[str] = None
+    location: Optional[str] = None
+    interests: List[str] = field(default_factory=list)
+    strengths: List[str] = field(default_factory=list)
+    constraints: List[str] = field(default_factory=list)
+    selected_career: Optional[str] = None
+    learning_style: Optional[str] = None
+    
+    def update(self, data: Dict):
+        """Update known fields from a dict (e.g. a generated career plan)"""
+        for f in fields(self):
+            if f.name in data:
+                setattr(self, f.name, data[f.name])
+    
+    def to_dict(self) -> Dict:
+        """Serialize profile for JSON responses"""
+        return asdict(self)
+
+
+# Number of exchanges kept in the live conversation window
+MAX_CONTEXT_TURNS = 100
+
+
+@dataclass(slots=True)
+class Turn:
+    """A single conversation message"""
+    role: str
+    content: str
+    language: str = "en"
+    intent: Optional[UserIntent] = None
+    phase: Optional[str] = None
+    plan_generated: bool = False
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    preview: str = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # Truncated content used by format_context_line, computed once at ingest
+        self.preview = self.content[:100]
+    
+    def to_dict(self) -> Dict:
+        """Serialize turn for history export (without the cached preview)"""
+        data = asdict(self)
+        del data["preview"]
+        if self.intent is not None:
+            data["intent"] = self.intent.label
+        return data
+
+
+@dataclass
+class SessionState:
+    """Per-session conversation state; replaced wholesale on reset"""
+    session_id: str
+    conversation: deque = field(default_factory=lambda: deque(maxlen=MAX_CONTEXT_TURNS * 2))
+    archive: List[Turn] = field(default_factory=list)
+    context_lines: deque = field(default_factory=lambda: deque(maxlen=CONTEXT_WINDOW))  # formatted once per message
+    summary_lines: List[str] = field(default_factory=list)  # early student lines that left context_lines
+    user_msg_count: int = 0
+    discovery_started: bool = False
+    exploration_completed: bool = False
+    plan_generated: bool = False
+    current_language: str = "en"
+    context_language: str = "en"  # language of the last 3 messages, for context prompts
+    context_language_age: int = 0  # messages since context_language was last set to Hindi/Hinglish
+    current_phase: str = "initial"  # initial, discovery, exploration, deep_dive, planning
+    student_profile: StudentProfile = field(default_factory=StudentProfile)
+    career_plan: Optional[Dict] = None
 
 
 class CareerGuidanceCounselor:
@@ -56,49 +137,77 @@ class CareerGuidanceCounselor:
                 "temperature": 0.7,
                 "max_output_tokens": 3000
             },
-            system_instruction=CareerGuidancePrompts.SYSTEM_PROMPT
+            system_instruction=get_prompt("SYSTEM_PROMPT")
         )
         
         self.session_id = session_id
-        self.conversation: List[Dict] = []
-        self.discovery_started = False
-        self.exploration_completed = False
-        self.plan_generated = False
-        self.current_language = "en"
-        self.current_phase = "initial"  # initial, discovery, exploration, deep_dive, planning
-        
-        # Student profile data
-        self.student_profile = {
-            "grade": None,
-            "age_range": None,
-            "location": None,
-            "interests": [],
-            "strengths": [],
-            "constraints": [],
-            "selected_career": None,
-            "learning_style": None
-        }
-        
-        # Career plan data
-        self.career_plan = None
+        self.state = SessionState(session_id=session_id)
         
         logger.info(f" CareerGuidanceCounselor initialized for session {session_id}")
     
+    # ==================== CONVERSATION STORAGE ====================
+    
+    def _append_message(self, message: Turn):
+        """Append a message, archiving the oldest one once the window is full"""
+        if len(self.state.conversation) == self.state.conversation.maxlen:
+            self.state.archive.append(self.state.conversation[0])
+        if len(self.state.context_lines) == CONTEXT_WINDOW and len(self.state.summary_lines) < SUMMARY_MAX_LINES:
+            # The line about to scroll out belongs to conversation[-CONTEXT_WINDOW]
+            leaving = self.state.conversation[-CONTEXT_WINDOW]
+            if leaving.role == "user":
+                self.state.summary_lines.append(self.state.context_lines[0])
+        self.state.conversation.append(message)
+        self.state.context_lines.append(CareerGuidancePrompts.format_context_line(message))
+        if message.role == "user":
+            self.state.user_msg_count += 1
+        # Latest Hindi/Hinglish language among the last CONTEXT_LANGUAGE_WINDOW messages
+        if message.language in ("hi", "hinglish"):
+            self.state.context_language = message.language
+            self.state.context_language_age = 0
+        else:
+            self.state.context_language_age += 1
+            if self.state.context_language_age >= CONTEXT_LANGUAGE_WINDOW:
+                self.state.context_language = "en"
+    
+    def _build_context(self) -> str:
+        """Context prompt for the live conversation window"""
+        return CareerGuidancePrompts.render_context(
+            self.state.context_lines, self.state.context_language, self.state.summary_lines
+        )
+    
+    def _examples(self, name: str, lang: str, *dynamic: str, scenarios: Optional[Tuple[str, ...]] = None) -> str:
+        """Example block for a template, trimmed so template + dynamic text + examples fit the token budget"""
+        budget = PROMPT_TOKEN_BUDGET - prompt_tokens(name) - sum(map(estimate_tokens, dynamic))
+        return get_examples(name, lang, fit_scenarios(name, lang, budget, scenarios))
+    
+    async def _generate(self, template: str, prompt, **kwargs):
+        """Call the model off the event loop and record its token usage under the template name"""
+        response = await asyncio.to_thread(self.model.generate_content, prompt, **kwargs)
+        usage = llm_metrics.record(template, response)
+        if usage is not None:
+            logger.info(
+                f" LLM {template}: {usage['prompt_tokens']} prompt tokens "
+                f"({usage['cached_tokens']} cached), {usage['output_tokens']} output tokens"
+            )
+        return response
+    
+    def _total_messages(self) -> int:
+        """Total messages including archived ones"""
+        return len(self.state.archive) + len(self.state.conversation)
+    
     # ==================== LANGUAGE DETECTION ====================
     
     def _detect_language(self, text: str) -> str:
-        """Detect if input is Hindi, Hinglish, or English"""
+        """Detect if input is Hindi, Hinglish, or English (expects stripped text)"""
         try:
-            text = text.strip()
             if not text:
                 return "en"
             
-            # Check for Hindi (Devanagari) characters
-            hindi_chars = sum(1 for c in text if '\u0900' <= c <= '\u097F')
-            total_alpha = len([c for c in text if c.isalpha()])
-            
-            if total_alpha > 0:
-                hindi_ratio = hindi_chars / total_alpha
+            # Check for Hindi (Devanagari) characters, skipping the scan for ASCII text
+            if not text.isascii() and DEVANAGARI_PATTERN.search(text):
+                hindi_chars = len(DEVANAGARI_PATTERN.findall(text))
+                total_alpha = sum(map(str.isalpha, text))
+                hindi_ratio = hindi_chars / max(total_alpha, 1)
                 
                 # Pure Hindi (>30% Devanagari)
                 if hindi_ratio > 0.3:
@@ -111,16 +220,8 @@ class CareerGuidanceCounselor:
                     return "hinglish"
             
             # Check for common Hinglish patterns (romanized Hindi)
-            hinglish_patterns = [
-                r'\b(kya|kaise|kitna|kitne|kab|kahan|kyun|aur|hai|hain|ho|hoon)\b',
-                r'\b(mujhe|mera|mere|apna|apne|tum|aap|yeh|woh|kuch)\b',
-                r'\b(chahiye|rakhna|dena|lena|samajh|batao|bolo)\b',
-                r'\b(bilkul|bahut|thoda|zyada|sab|koi|kaun)\b',
-                r'\b(namaste|shukriya|dhanyavaad|theek|acha|haan|nahi)\b'
-            ]
-            
             text_lower = text.lower()
-            hinglish_matches = sum(1 for p in hinglish_patterns if re.search(p, text_lower))
+            hinglish_matches = len({match.lastgroup for match in HINGLISH_PATTERN.finditer(text_lower)})
             
             total_words = len(text_lower.split())
             if total_words > 0:
@@ -141,7 +242,7 @@ class CareerGuidanceCounselor:
         """Convert text to speech using gTTS with language support"""
         try:
             if language is None:
-                language = self.current_language
+                language = self.state.current_language
             
             clean_text = re.sub(r'[*_`\[\]#{}()\|]', '', text)
             clean_text = re.sub(r'\s+', ' ', clean_text).strip()
@@ -171,54 +272,76 @@ class CareerGuidanceCounselor:
     
     # ==================== INTENT DETECTION ====================
     
+    def _classify_intent_locally(self, user_input: str) -> Optional[Dict]:
+        """Classify intent from trigger phrases, then the local model; None when both are unsure"""
+        intent = CareerGuidancePrompts.classify_fast(user_input)
+        confidence = 0.9
+        
+        if intent is None:
+            intent = CareerGuidancePrompts.classify_fuzzy(user_input)
+            confidence = 0.8
+        
+        if intent is None:
+            prediction = intent_classifier.predict(user_input)
+            if prediction is None:
+                return None
+            intent, confidence = prediction
+        
+        return {
+            "intent": intent,
+            "confidence": confidence,
+            "language": self.state.current_language
+        }
+    
     async def _classify_intent(self, user_input: str) -> Dict:
         """Classify user intent with language detection"""
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
+        local_result = self._classify_intent_locally(user_input)
+        if local_result is not None:
+            logger.info(f" Intent matched locally: {local_result['intent'].label}")
+            return local_result
         
-        prompt = CareerGuidancePrompts.INTENT_DETECTION_PROMPT.format(
-            user_input=user_input,
-            context=context
-        )
+        context = self._build_context()
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
-            result_text = response.text.strip()
-            
-            # Extract JSON from response
-            json_match = re.search(r'\{.*\}', result_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-            else:
-                result = {
-                    "intent": "general_question",
-                    "confidence": 0.5,
-                    "language": self.current_language,
-                    "detected_interests": [],
-                    "detected_constraints": []
-                }
-            
-            return result
+            intent = await self._classify_intent_with_llm(user_input, context)
+            return {
+                "intent": UserIntent.GENERAL_QUESTION if intent is None else intent,
+                "confidence": 0.5,
+                "language": self.state.current_language
+            }
             
         except Exception as e:
             logger.error(f" Intent classification failed: {e}")
             return {
                 "intent": UserIntent.GENERAL_QUESTION,
                 "confidence": 0.5,
-                "language": self.current_language
+                "language": self.state.current_language
             }
     
+    async def _classify_intent_with_llm(self, user_input: str, context: str) -> Optional[UserIntent]:
+        """Classify with INTENT_DETECTION_PROMPT; None when the reply is not a known intent"""
+        prompt = CareerGuidancePrompts.render_parts("INTENT_DETECTION_PROMPT",
+            user_input=user_input,
+            context=context
+        )
+        
+        # The enum schema restricts the reply to a bare intent name
+        response = await self._generate("INTENT_DETECTION_PROMPT", prompt,
+                                        generation_config=dict(INTENT_GENERATION_CONFIG))
+        return UserIntent.parse(response.text.strip())
+    
     # ==================== FIRST MESSAGE HANDLER ====================
     
     async def _handle_first_message(self, user_input: str) -> str:
         """Generate personalized first response"""
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
-        prompt = CareerGuidancePrompts.FIRST_MESSAGE_PROMPT.format(
+        context = self._build_context()
+        prompt = CareerGuidancePrompts.render_parts("FIRST_MESSAGE_RESPONSE",
             user_input=user_input,
             context=context
         )
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
+            response = await self._generate("FIRST_MESSAGE_RESPONSE", prompt)
             return response.text.strip()
         except Exception as e:
             logger.error(f" First message generation failed: {e}")
@@ -228,17 +351,20 @@ class CareerGuidanceCounselor:
                 "hi": "नमस्ते! मैं आपका AI करियर काउंसलर हूँ। मैं हाई स्कूल के छात्रों को करियर मार्ग खोजने में मदद करता हूँ। आप किस कक्षा में हैं?",
                 "hinglish": "Namaste! Main aapka AI career counselor hoon. Main students ko career paths discover karne mein help karta hoon. Aap kis grade mein ho?"
             }
-            return fallbacks.get(self.current_language, fallbacks["en"])
+            return fallbacks.get(self.state.current_language, fallbacks["en"])
     
     # ==================== DISCOVERY QUESTION GENERATOR ====================
     
     async def _generate_discovery_question(self) -> str:
         """Generate next discovery question"""
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
-        prompt = CareerGuidancePrompts.DISCOVERY_QUESTION_PROMPT.format(context=context)
+        context = self._build_context()
+        prompt = CareerGuidancePrompts.render_parts("DISCOVERY_QUESTION_PROMPT",
+            context=context,
+            examples=self._examples("DISCOVERY_QUESTION_PROMPT", self.state.context_language, context)
+        )
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
+            response = await self._generate("DISCOVERY_QUESTION_PROMPT", prompt)
             question = response.text.strip()
             
             # Clean the question
@@ -255,7 +381,7 @@ class CareerGuidanceCounselor:
     
     def _get_fallback_discovery_question(self) -> str:
         """Get fallback discovery question"""
-        user_responses = len([m for m in self.conversation if m['role'] == 'user'])
+        user_responses = self.state.user_msg_count
         
         fallback_questions = {
             "en": [
@@ -281,7 +407,7 @@ class CareerGuidanceCounselor:
             ]
         }
         
-        questions = fallback_questions.get(self.current_language, fallback_questions["en"])
+        questions = fallback_questions.get(self.state.current_language, fallback_questions["en"])
         idx = min(user_responses, len(questions) - 1)
         return questions[idx]
     
@@ -289,24 +415,35 @@ class CareerGuidanceCounselor:
     
     async def _generate_career_matches(self) -> str:
         """Generate career stream suggestions"""
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
+        context = self._build_context()
         
         # Extract student info from conversation
-        grade = self.student_profile.get("grade", "Not specified")
-        interests = ", ".join(self.student_profile.get("interests", ["exploring"]))
-        strengths = ", ".join(self.student_profile.get("strengths", ["to be discovered"]))
-        constraints = ", ".join(self.student_profile.get("constraints", ["none mentioned"]))
+        grade = self.state.student_profile.grade or "Not specified"
+        interests = ", ".join(self.state.student_profile.interests or ["exploring"])
+        strengths = ", ".join(self.state.student_profile.strengths or ["to be discovered"])
+        constraints = ", ".join(self.state.student_profile.constraints or ["none mentioned"])
+        location = self.state.student_profile.location or "Not specified"
+        
+        # Only the career example categories the student's own words point to
+        student_text = " ".join(chain(
+            self.state.student_profile.interests,
+            self.state.student_profile.strengths,
+            (turn.content for turn in self.state.conversation if turn.role == "user")
+        ))
+        categories = match_scenarios("CAREER_MATCHING_PROMPT", student_text)
         
-        prompt = CareerGuidancePrompts.CAREER_MATCHING_PROMPT.format(
+        prompt = CareerGuidancePrompts.render_parts("CAREER_MATCHING_PROMPT",
             context=context,
             grade=grade,
             interests=interests,
             strengths=strengths,
-            constraints=constraints
+            constraints=constraints,
+            location=location,
+            examples=self._examples("CAREER_MATCHING_PROMPT", "en", context, scenarios=categories)
         )
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
+            response = await self._generate("CAREER_MATCHING_PROMPT", prompt)
             return response.text.strip()
         except Exception as e:
             logger.error(f" Career matching failed: {e}")
@@ -319,7 +456,7 @@ class CareerGuidanceCounselor:
             "hi": "आपने जो बताया उसके आधार पर, यहां कुछ रोमांचक करियर पथ हैं: टेक्नोलॉजी (सॉफ्टवेयर, डेटा साइंस), हेल्थकेयर (मेडिसिन, बायोटेक), बिजनेस (मार्केटिंग, फाइनेंस), या क्रिएटिव फील्ड (डिज़ाइन, कंटेंट)। कौन सा आपको सबसे अधिक रुचिकर लगता है?",
             "hinglish": "Aapne jo bataya uske basis par, yahan kuch exciting career paths hain: Technology (Software, Data Science), Healthcare (Medicine, Biotech), Business (Marketing, Finance), ya Creative fields (Design, Content). Kaunsa aapko sabse zyada interesting lagta hai?"
         }
-        return fallbacks.get(self.current_language, fallbacks["en"])
+        return fallbacks.get(self.state.current_language, fallbacks["en"])
     
     # ==================== CAREER PLAN GENERATION ====================
     
@@ -332,30 +469,31 @@ class CareerGuidanceCounselor:
             logger.info(" Generating comprehensive career plan...")
             
             # Check if we have enough information
-            user_responses = len([m for m in self.conversation if m['role'] == 'user'])
+            user_responses = self.state.user_msg_count
             if user_responses < 5:
                 message = self._get_insufficient_info_message()
                 return None, message
             
             # Prepare context and profile
-            context = CareerGuidancePrompts.build_context_prompt(self.conversation)
+            context = self._build_context()
             
             # Extract profile from conversation
             profile = self._extract_profile_from_conversation()
             
             # Use your existing prompt
-            prompt = CareerGuidancePrompts.COMPLETE_CAREER_PLAN_JSON.format(
+            prompt = CareerGuidancePrompts.render_parts("COMPLETE_CAREER_PLAN_JSON",
                 context=context,
                 student_id=self.session_id,
                 grade=profile.get("grade", "Not specified"),
                 interests=", ".join(profile.get("interests", ["exploring"])),
                 strengths=", ".join(profile.get("strengths", ["to be discovered"])),
                 constraints=", ".join(profile.get("constraints", ["none"])),
-                target_career=profile.get("selected_career", "To be determined")
+                target_career=profile.get("selected_career", "To be determined"),
+                plan_skeleton=get_plan_skeleton()
             )
             
             # Generate response
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
+            response = await self._generate("COMPLETE_CAREER_PLAN_JSON", prompt)
             result_text = response.text.strip()
             
             # Extract JSON from response
@@ -369,12 +507,12 @@ class CareerGuidanceCounselor:
                     
                     # Update student profile with extracted info
                     if "student_profile" in career_plan:
-                        self.student_profile.update(career_plan["student_profile"])
+                        self.state.student_profile.update(career_plan["student_profile"])
                     
                     # Save the plan
-                    self.career_plan = career_plan
-                    self.plan_generated = True
-                    self.current_phase = "planning"
+                    self.state.career_plan = career_plan
+                    self.state.plan_generated = True
+                    self.state.current_phase = "planning"
                     
                     # Generate user message
                     message = self._get_plan_generated_message(career_plan)
@@ -385,16 +523,16 @@ class CareerGuidanceCounselor:
                 except json.JSONDecodeError as e:
                     logger.error(f" JSON parsing error: {e}")
                     fallback_plan = self._generate_fallback_plan()
-                    self.career_plan = fallback_plan
-                    self.plan_generated = True
+                    self.state.career_plan = fallback_plan
+                    self.state.plan_generated = True
                     message = self._get_plan_generated_message(fallback_plan)
                     return fallback_plan, message
             else:
                 # Fallback if no JSON found
                 logger.warning(" No JSON found in response, using fallback plan")
                 fallback_plan = self._generate_fallback_plan()
-                self.career_plan = fallback_plan
-                self.plan_generated = True
+                self.state.career_plan = fallback_plan
+                self.state.plan_generated = True
                 message = self._get_plan_generated_message(fallback_plan)
                 return fallback_plan, message
                 
@@ -406,20 +544,20 @@ class CareerGuidanceCounselor:
     def _extract_profile_from_conversation(self) -> Dict:
         """Extract student profile from conversation history"""
         profile = {
-            "grade": self.student_profile.get("grade"),
+            "grade": self.state.student_profile.grade,
             "age_range": None,
             "location": None,
-            "interests": self.student_profile.get("interests", []),
-            "strengths": self.student_profile.get("strengths", []),
-            "constraints": self.student_profile.get("constraints", []),
-            "selected_career": self.student_profile.get("selected_career"),
+            "interests": self.state.student_profile.interests,
+            "strengths": self.state.student_profile.strengths,
+            "constraints": self.state.student_profile.constraints,
+            "selected_career": self.state.student_profile.selected_career,
             "learning_style": None
         }
         
         # Try to extract more info from conversation
-        for message in self.conversation:
-            if message['role'] == 'user':
-                content = message['content'].lower()
+        for message in chain(self.state.archive, self.state.conversation):
+            if message.role == 'user':
+                content = message.content.lower()
                 
                 # Extract grade
                 if not profile["grade"]:
@@ -477,7 +615,7 @@ class CareerGuidanceCounselor:
         career_plan["metadata"] = {
             "session_id": self.session_id,
             "generated_at": datetime.now().isoformat(),
-            "conversation_messages": len(self.conversation)
+            "conversation_messages": self._total_messages()
         }
         
         return career_plan
@@ -569,7 +707,7 @@ class CareerGuidanceCounselor:
             "metadata": {
                 "session_id": self.session_id,
                 "generated_at": datetime.now().isoformat(),
-                "conversation_messages": len(self.conversation),
+                "conversation_messages": self._total_messages(),
                 "note": "Fallback plan generated due to AI limitations"
             }
         }
@@ -581,7 +719,7 @@ class CareerGuidanceCounselor:
             "hi": "आपके लिए एक व्यापक करियर योजना बनाने के लिए मुझे थोड़ी और जानकारी चाहिए। क्या आप अपनी रुचियों और लक्ष्यों के बारे में और बता सकते हैं?",
             "hinglish": "Aapke liye ek comprehensive career plan banane ke liye mujhe thodi aur information chahiye. Kya aap apni interests aur goals ke baare mein aur bata sakte ho?"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_plan_generated_message(self, career_plan: Dict) -> str:
         """Message when plan is successfully generated"""
@@ -592,7 +730,7 @@ class CareerGuidanceCounselor:
             "hi": f" मैंने आपके लिए एक व्यापक करियर योजना बनाई है! मैं **{primary_career}** को आपके प्राथमिक मार्ग के रूप में सलाह देता हूँ। योजना में शिक्षा आवश्यकताएं, कौशल विकास रोडमैप, वित्तीय योजना और आवेदन समय सारणी शामिल है। आप इसे PDF के रूप में डाउनलोड कर सकते हैं या विवरण यहाँ देख सकते हैं।",
             "hinglish": f" Maine aapke liye ek comprehensive career plan banayi hai! Main **{primary_career}** ko aapke primary path ke taur par recommend karta hoon. Plan mein education requirements, skill development roadmap, financial planning, aur application timeline shamil hai. Aap ise PDF ke roop mein download kar sakte ho ya details yahan dekh sakte ho."
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_plan_error_message(self) -> str:
         """Error message for plan generation failure"""
@@ -601,20 +739,22 @@ class CareerGuidanceCounselor:
             "hi": "आपकी करियर योजना बनाते समय मुझे एक समस्या आई। आइए अधिक जानकारी एकत्र करने के लिए अपनी बातचीत जारी रखें, फिर पुनः प्रयास करें।",
             "hinglish": "Aapki career plan banate samay mujhe ek issue aaya. Chalo aur information gather karne ke liye apni baatcheet jari rakhein, phir try karte hain."
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     # ==================== UNCERTAINTY HANDLER ====================
     
     async def _handle_uncertainty(self, user_input: str) -> str:
         """Handle student uncertainty with supportive guidance"""
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
-        prompt = CareerGuidancePrompts.UNCERTAINTY_PROMPT.format(
+        context = self._build_context()
+        prompt = CareerGuidancePrompts.render_parts("UNCERTAINTY_PROMPT",
             user_input=user_input,
-            context=context
+            context=context,
+            examples=self._examples("UNCERTAINTY_PROMPT", self.state.context_language, context, user_input,
+                                    scenarios=match_scenarios("UNCERTAINTY_PROMPT", user_input))
         )
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
+            response = await self._generate("UNCERTAINTY_PROMPT", prompt)
             return response.text.strip()
         except Exception as e:
             logger.error(f" Uncertainty handling failed: {e}")
@@ -623,25 +763,40 @@ class CareerGuidanceCounselor:
                 "hi": "यह बिल्कुल सामान्य है! अधिकांश छात्र ऐसा महसूस करते हैं। चलिए साथ मिलकर खोजते हैं। आप किस कक्षा में हैं?",
                 "hinglish": "Yeh bilkul normal hai! Zyada tar students aisa feel karte hain. Chalo saath mein explore karte hain. Aap kis class mein ho?"
             }
-            return fallbacks.get(self.current_language, fallbacks["en"])
+            return fallbacks.get(self.state.current_language, fallbacks["en"])
     
     # ==================== PROGRESS CHECK ====================
     
+    def _cheap_progress_gate(self) -> Optional[Dict]:
+        """Decide the phase from the message count alone when the outcome is obvious"""
+        # Only the number of answers decides it; the profile is not filled in
+        user_responses = self.state.user_msg_count
+        
+        if user_responses < PROGRESS_MIN_MESSAGES:
+            return {"phase": "discovery", "ready_for_matching": False}
+        
+        if user_responses >= PROGRESS_READY_MESSAGES:
+            return {"phase": "exploration", "ready_for_matching": True}
+        
+        return None
+    
     async def _check_phase_progress(self) -> Dict:
         """Check conversation progress and determine next phase"""
-        user_responses = len([m for m in self.conversation if m['role'] == 'user'])
+        user_responses = self.state.user_msg_count
         
-        if user_responses < 2:
-            return {"phase": "discovery", "ready_for_matching": False}
+        # Skip the LLM round-trip when the message count already decides it
+        gated = self._cheap_progress_gate()
+        if gated is not None:
+            return gated
         
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
-        prompt = CareerGuidancePrompts.PROGRESS_CHECK_PROMPT.format(
+        context = self._build_context()
+        prompt = CareerGuidancePrompts.render_parts("PROGRESS_CHECK_PROMPT",
             context=context,
             message_count=user_responses
         )
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
+            response = await self._generate("PROGRESS_CHECK_PROMPT", prompt)
             result_text = response.text.strip()
             
             # Extract JSON
@@ -661,17 +816,35 @@ class CareerGuidanceCounselor:
     
     # ==================== CASUAL CHAT HANDLER ====================
     
-    async def _handle_casual_chat(self, user_input: str) -> str:
-        """Handle casual conversation"""
-        context = CareerGuidancePrompts.build_context_prompt(self.conversation)
-        prompt = CareerGuidancePrompts.CASUAL_CHAT_PROMPT.format(
+    async def _handle_casual_chat(self, user_input: str, cacheable: bool = False) -> str:
+        """Handle casual conversation, sharing cacheable answers across sessions"""
+        # The context language, not the message's, keys the shared cache
+        lang = self.state.context_language
+        if cacheable:
+            cached = response_cache.get(lang, user_input)
+            if cached is not None:
+                logger.info(" Response cache hit")
+                return cached
+        
+        if cacheable:
+            # Shared with every session, so built without this conversation
+            context = CareerGuidancePrompts.render_context((), lang)
+        else:
+            context = self._build_context()
+        # The user's turn (appended just before dispatch) carries the intent
+        scenarios = CASUAL_CHAT_SCENARIOS.get(self.state.conversation[-1].intent)
+        prompt = CareerGuidancePrompts.render_parts("CASUAL_CHAT_PROMPT",
             user_input=user_input,
-            context=context
+            context=context,
+            examples=self._examples("CASUAL_CHAT_PROMPT", lang, context, user_input, scenarios=scenarios)
         )
         
         try:
-            response = await asyncio.to_thread(self.model.generate_content, prompt)
-            return response.text.strip()
+            response = await self._generate("CASUAL_CHAT_PROMPT", prompt)
+            text = response.text.strip()
+            if cacheable:
+                response_cache.put(lang, user_input, text)
+            return text
         except Exception as e:
             logger.error(f" Casual chat failed: {e}")
             fallbacks = {
@@ -679,18 +852,18 @@ class CareerGuidanceCounselor:
                 "hi": "मैं आपके करियर अन्वेषण में मदद करने के लिए यहाँ हूँ। आप क्या जानना चाहेंगे?",
                 "hinglish": "Main aapke career exploration mein help karne ke liye yahan hoon. Aap kya jaanna chahte ho?"
             }
-            return fallbacks.get(self.current_language, fallbacks["en"])
+            return fallbacks.get(self.state.current_language, fallbacks["en"])
     
     # ==================== PLAN REQUEST HANDLER ====================
     
     async def _handle_plan_request(self, user_input: str) -> str:
         """Handle requests for career plan"""
         # Check if we already have a plan
-        if self.plan_generated and self.career_plan:
+        if self.state.plan_generated and self.state.career_plan:
             return self._get_existing_plan_message()
         
         # Check if we have enough information
-        user_responses = len([m for m in self.conversation if m['role'] == 'user'])
+        user_responses = self.state.user_msg_count
         
         if user_responses < 5:
             return self._get_need_more_info_message()
@@ -700,25 +873,24 @@ class CareerGuidanceCounselor:
         
         if career_plan:
             # Add the plan message to conversation
-            self.conversation.append({
-                "role": "assistant",
-                "content": message,
-                "plan_generated": True,
-                "timestamp": datetime.now().isoformat()
-            })
+            self._append_message(Turn(
+                role="assistant",
+                content=message,
+                plan_generated=True
+            ))
         
         return message
     
     def _get_existing_plan_message(self) -> str:
         """Message when plan already exists"""
-        primary_career = self.career_plan.get("career_recommendation", {}).get("primary_career", "your chosen career")
+        primary_career = self.state.career_plan.get("career_recommendation", {}).get("primary_career", "your chosen career")
         
         messages = {
             "en": f"I've already created a career plan for you focusing on **{primary_career}**. Would you like me to share it again or update it with new information?",
             "hi": f"मैंने पहले ही **{primary_career}** पर केंद्रित आपके लिए एक करियर योजना बनाई है। क्या आप चाहेंगे कि मैं इसे फिर से साझा करूं या नई जानकारी के साथ इसे अपडेट करूं?",
             "hinglish": f"Maine pehle hi **{primary_career}** par focus karte hue aapke liye ek career plan banayi hai. Kya aap chahte ho ki main ise phir se share karoon ya nayi information ke saath ise update karoon?"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_need_more_info_message(self) -> str:
         """Message when more info is needed for plan"""
@@ -727,7 +899,110 @@ class CareerGuidanceCounselor:
             "hi": "मैं आपके लिए एक व्यापक करियर योजना बनाना चाहूंगा! पहले, मुझे आपके बारे में थोड़ा और जानना होगा। क्या आप मुझे अपनी शैक्षिक रुचियों, शौक और किसी भी करियर क्षेत्र के बारे में बता सकते हैं जिसके बारे में आप उत्सुक हैं?",
             "hinglish": "Main aapke liye ek comprehensive career plan banana chahta hoon! Pehle, mujhe aapke baare mein thoda aur jaanna hoga. Kya aap mujhe apni academic interests, hobbies, aur kisi bhi career field ke baare mein bata sakte ho jiske baare mein aap curious ho?"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
+    
+    # ==================== INTENT HANDLERS ====================
+    
+    def _start_discovery(self):
+        """Enter the discovery phase"""
+        self.state.discovery_started = True
+        self.state.current_phase = "discovery"
+    
+    async def _on_request_plan(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Handle career plan request"""
+        response = await self._handle_plan_request(user_input)
+        return response, {"plan_requested": True}
+    
+    async def _on_greeting(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """First greeting; later greetings continue the conversation"""
+        if self.state.discovery_started:
+            return await self._on_default(user_input)
+        
+        response = await self._handle_first_message(user_input)
+        self._start_discovery()
+        return response, None
+    
+    async def _on_ready_to_start(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Ready to start"""
+        if not self.state.discovery_started:
+            response = await self._handle_first_message("ready")
+            self._start_discovery()
+        else:
+            response = await self._generate_discovery_question()
+        return response, None
+    
+    async def _on_career_exploration(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Student exploring careers"""
+        if not self.state.discovery_started:
+            self._start_discovery()
+        
+        # Check if we have enough info for career matching
+        progress = await self._check_phase_progress()
+        if progress.get("ready_for_matching", False):
+            response = await self._generate_career_matches()
+            self.state.current_phase = "exploration"
+        else:
+            response = await self._generate_discovery_question()
+        return response, None
+    
+    async def _on_uncertainty(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Handle uncertainty"""
+        response = await self._handle_uncertainty(user_input)
+        if not self.state.discovery_started:
+            self._start_discovery()
+        return response, None
+    
+    async def _on_parental_pressure(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Handle parental pressure specifically"""
+        return self._get_parental_pressure_response(), None
+    
+    async def _on_gratitude(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Thank you response"""
+        if self.state.current_phase == "initial":
+            response = self._get_gratitude_response() + " " + await self._handle_first_message("thanks")
+            self._start_discovery()
+        else:
+            response = self._get_gratitude_response() + " " + self._get_continue_prompt()
+        return response, None
+    
+    async def _on_casual_chat(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Clarification, off-topic or general questions"""
+        return await self._handle_casual_chat(user_input), None
+    
+    async def _on_general_question(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Standalone questions; rephrasings of earlier ones reuse the cached answer"""
+        return await self._handle_casual_chat(user_input, cacheable=True), None
+    
+    async def _on_default(self, user_input: str) -> Tuple[str, Optional[Dict]]:
+        """Default: Continue discovery or exploration"""
+        if self.state.current_phase == "initial" or not self.state.discovery_started:
+            self._start_discovery()
+            return await self._generate_discovery_question(), None
+        
+        # Check progress
+        progress = await self._check_phase_progress()
+        if progress.get("ready_for_matching", False) and self.state.current_phase == "discovery":
+            response = await self._generate_career_matches()
+            self.state.current_phase = "exploration"
+        else:
+            response = await self._generate_discovery_question()
+        return response, None
+    
+    _HANDLERS_BY_INTENT: Dict[UserIntent, Callable] = {
+        UserIntent.REQUEST_PLAN: _on_request_plan,
+        UserIntent.GREETING: _on_greeting,
+        UserIntent.READY_TO_START: _on_ready_to_start,
+        UserIntent.CAREER_EXPLORATION: _on_career_exploration,
+        UserIntent.UNCERTAINTY: _on_uncertainty,
+        UserIntent.PARENTAL_PRESSURE: _on_parental_pressure,
+        UserIntent.GRATITUDE: _on_gratitude,
+        UserIntent.CLARIFICATION_QUESTION: _on_casual_chat,
+        UserIntent.OFF_TOPIC: _on_casual_chat,
+        UserIntent.GENERAL_QUESTION: _on_general_question
+    }
+    
+    # Dispatch table indexed by UserIntent value; unlisted intents use _on_default
+    INTENT_HANDLERS: Tuple[Callable, ...] = tuple(map(_HANDLERS_BY_INTENT.get, UserIntent, repeat(_on_default)))
     
     # ==================== MAIN PROCESSING ====================
     
@@ -736,128 +1011,44 @@ class CareerGuidanceCounselor:
         Main processing: Language-first, intent-based, phase-aware responses
         """
         try:
+            # Strip once; everything downstream receives the cleaned input
+            user_input = user_input.strip() if user_input else ""
             logger.info(f" Processing: '{user_input[:50]}...'")
             
             # Skip empty inputs
-            if not user_input or len(user_input.strip()) < 1:
+            if not user_input:
                 response = self._get_empty_response()
                 audio_base64 = await self.text_to_speech(response)
                 return response, audio_base64, None
             
             # STEP 1: Detect language
             detected_language = self._detect_language(user_input)
-            self.current_language = detected_language
+            self.state.current_language = detected_language
             logger.info(f" Language: {detected_language}")
             
             # STEP 2: Detect intent
             intent_data = await self._classify_intent(user_input)
             intent = intent_data.get("intent", UserIntent.GENERAL_QUESTION)
-            logger.info(f" Intent: {intent} | Phase: {self.current_phase}")
-            
-            # Update student profile with detected interests/constraints
-            if "detected_interests" in intent_data:
-                self.student_profile["interests"].extend(intent_data["detected_interests"])
-            if "detected_constraints" in intent_data:
-                self.student_profile["constraints"].extend(intent_data["detected_constraints"])
+            logger.info(f" Intent: {intent.label} | Phase: {self.state.current_phase}")
             
             # Save user message
-            self.conversation.append({
-                "role": "user",
-                "content": user_input,
-                "language": detected_language,
-                "intent": intent,
-                "timestamp": datetime.now().isoformat()
-            })
+            self._append_message(Turn(
+                role="user",
+                content=user_input,
+                language=detected_language,
+                intent=intent
+            ))
             
             # STEP 3: Handle based on intent and phase
-            response = ""
-            metadata = None
-            
-            if intent == UserIntent.REQUEST_PLAN:
-                # Handle career plan request
-                response = await self._handle_plan_request(user_input)
-                metadata = {"plan_requested": True}
-                
-            elif intent == UserIntent.GREETING and not self.discovery_started:
-                # First greeting
-                response = await self._handle_first_message(user_input)
-                self.discovery_started = True
-                self.current_phase = "discovery"
-                
-            elif intent == UserIntent.READY_TO_START:
-                # Ready to start
-                if not self.discovery_started:
-                    response = await self._handle_first_message("ready")
-                    self.discovery_started = True
-                    self.current_phase = "discovery"
-                else:
-                    response = await self._generate_discovery_question()
-                
-            elif intent == UserIntent.CAREER_EXPLORATION:
-                # Student exploring careers
-                if not self.discovery_started:
-                    self.discovery_started = True
-                    self.current_phase = "discovery"
-                
-                # Check if we have enough info for career matching
-                progress = await self._check_phase_progress()
-                if progress.get("ready_for_matching", False):
-                    response = await self._generate_career_matches()
-                    self.current_phase = "exploration"
-                else:
-                    response = await self._generate_discovery_question()
-                
-            elif intent == UserIntent.UNCERTAINTY:
-                # Handle uncertainty
-                response = await self._handle_uncertainty(user_input)
-                if not self.discovery_started:
-                    self.discovery_started = True
-                    self.current_phase = "discovery"
-                
-            elif intent == UserIntent.PARENTAL_PRESSURE:
-                # Handle parental pressure specifically
-                response = self._get_parental_pressure_response()
-                
-            elif intent == UserIntent.GRATITUDE:
-                # Thank you response
-                if self.current_phase == "initial":
-                    response = self._get_gratitude_response() + " " + await self._handle_first_message("thanks")
-                    self.discovery_started = True
-                    self.current_phase = "discovery"
-                else:
-                    response = self._get_gratitude_response() + " " + self._get_continue_prompt()
-                
-            elif intent == UserIntent.CLARIFICATION_QUESTION:
-                # Clarification needed
-                response = await self._handle_casual_chat(user_input)
-                
-            elif intent in [UserIntent.OFF_TOPIC, UserIntent.GENERAL_QUESTION]:
-                # Off-topic or general
-                response = await self._handle_casual_chat(user_input)
-                
-            else:
-                # Default: Continue discovery or exploration
-                if self.current_phase == "initial" or not self.discovery_started:
-                    self.discovery_started = True
-                    self.current_phase = "discovery"
-                    response = await self._generate_discovery_question()
-                else:
-                    # Check progress
-                    progress = await self._check_phase_progress()
-                    if progress.get("ready_for_matching", False) and self.current_phase == "discovery":
-                        response = await self._generate_career_matches()
-                        self.current_phase = "exploration"
-                    else:
-                        response = await self._generate_discovery_question()
+            response, metadata = await self.INTENT_HANDLERS[intent](self, user_input)
             
             # STEP 4: Save and convert to speech
-            self.conversation.append({
-                "role": "assistant",
-                "content": response,
-                "language": detected_language,
-                "phase": self.current_phase,
-                "timestamp": datetime.now().isoformat()
-            })
+            self._append_message(Turn(
+                role="assistant",
+                content=response,
+                language=detected_language,
+                phase=self.state.current_phase
+            ))
             
             audio_base64 = await self.text_to_speech(response, detected_language)
             return response, audio_base64, metadata
@@ -877,7 +1068,7 @@ class CareerGuidanceCounselor:
             "hi": "मुझे वह समझ नहीं आया। क्या आप कुछ कह सकते हैं?",
             "hinglish": "Mujhe samajh nahi aaya. Kuch bolo na?"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_gratitude_response(self) -> str:
         """Get gratitude response"""
@@ -886,7 +1077,7 @@ class CareerGuidanceCounselor:
             "hi": "आपका स्वागत है!",
             "hinglish": "Bilkul welcome!"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_continue_prompt(self) -> str:
         """Get prompt to continue conversation"""
@@ -895,7 +1086,7 @@ class CareerGuidanceCounselor:
             "hi": "आप और क्या खोजना चाहेंगे?",
             "hinglish": "Aur kya explore karna hai?"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_parental_pressure_response(self) -> str:
         """Get response for parental pressure"""
@@ -904,7 +1095,7 @@ class CareerGuidanceCounselor:
             "hi": "मैं समझता हूं - परिवार की अपेक्षाएं महत्वपूर्ण हैं। चलिए ऐसे करियर खोजें जो आपकी रुचियों और आपके माता-पिता की स्थिरता दोनों के अनुरूप हों। मुझे बताएं कि आप क्या पसंद करते हैं, और मैं आपको उस क्षेत्र में सुरक्षित करियर विकल्प दिखाऊंगा।",
             "hinglish": "Main samajhta hoon - family expectations important hote hain. Chalo aise careers dhoondhein jo aapki interests aur aapke parents ki stability dono ke saath align karein. Mujhe batao ki aap kya enjoy karte ho, aur main aapko us field mein secure career options dikhaaunga."
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     def _get_error_message(self) -> str:
         """Get error message"""
@@ -913,53 +1104,36 @@ class CareerGuidanceCounselor:
             "hi": "मैं माफी चाहता हूँ, मुझे एक त्रुटि का सामना करना पड़ा। क्या आप दोबारा कह सकते हैं?",
             "hinglish": "Sorry, mujhe error aaya. Thoda aur clear bolo na?"
         }
-        return messages.get(self.current_language, messages["en"])
+        return messages.get(self.state.current_language, messages["en"])
     
     # ==================== UTILITY METHODS ====================
     
     def get_conversation_history(self) -> List[Dict]:
         """Get full conversation history"""
-        return self.conversation
+        return [turn.to_dict() for turn in chain(self.state.archive, self.state.conversation)]
     
     def get_career_plan(self) -> Optional[Dict]:
         """Get generated career plan"""
-        return self.career_plan
+        return self.state.career_plan
     
     def clear_conversation(self):
         """Reset conversation"""
-        self.conversation = []
-        self.discovery_started = False
-        self.exploration_completed = False
-        self.plan_generated = False
-        self.current_language = "en"
-        self.current_phase = "initial"
-        self.student_profile = {
-            "grade": None,
-            "age_range": None,
-            "location": None,
-            "interests": [],
-            "strengths": [],
-            "constraints": [],
-            "selected_career": None,
-            "learning_style": None
-        }
-        self.career_plan = None
+        self.state = SessionState(session_id=self.session_id)
         logger.info(" Conversation cleared")
     
     def get_stats(self) -> Dict:
         """Get conversation statistics"""
-        user_msgs = [m for m in self.conversation if m.get('role') == 'user']
-        assistant_msgs = [m for m in self.conversation if m.get('role') == 'assistant']
+        total_messages = self._total_messages()
         
         return {
             "session_id": self.session_id,
-            "total_messages": len(self.conversation),
-            "user_messages": len(user_msgs),
-            "assistant_messages": len(assistant_msgs),
-            "discovery_started": self.discovery_started,
-            "current_phase": self.current_phase,
-            "current_language": self.current_language,
-            "plan_generated": self.plan_generated,
-            "student_profile": self.student_profile,
-            "last_interaction": self.conversation[-1]['timestamp'] if self.conversation else None
+            "total_messages": total_messages,
+            "user_messages": self.state.user_msg_count,
+            "assistant_messages": total_messages - self.state.user_msg_count,
+            "discovery_started": self.state.discovery_started,
+            "current_phase": self.state.current_phase,
+            "current_language": self.state.current_language,
+            "plan_generated": self.state.plan_generated,
+            "student_profile": self.state.student_profile.to_dict(),
+            "last_interaction": self.state.conversation[-1].timestamp if self.state.conversation else None
         }
\ No newline at end of file
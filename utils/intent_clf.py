@@ -0,0 +1,148 @@
+import math
+import logging
+import re
+import string
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from utils.prompt import INTENT_EXAMPLES, INTENT_TRIGGERS
+
+logger = logging.getLogger(__name__)
+
+
+# Minimum posterior probability before trusting the local prediction
+MIN_CONFIDENCE = 0.6
+
+# Naive Bayes posteriors are overconfident on text unlike anything in the
+# training data, so also require this cosine similarity between the input
+# and its nearest training phrase for the predicted intent
+MIN_SIMILARITY = 0.45
+
+# Words too common to tell intents apart (English and romanized Hindi)
+STOPWORDS = frozenset("""
+a an the is are was were be am do does did i me my you your we our it its this that these those
+what which who whom how why when where can could should would will shall may might must
+to of in on at for from by with about as and or but if so not no
+kya hai hain ka ki ke ko se mein me aur ya ho hoon tha thi kaise kaun kab kahan kyun
+""".split())
+
+# ASCII punctuation plus the Devanagari danda; \W would also strip Hindi vowel signs
+PUNCTUATION_PATTERN = re.compile(f"[{re.escape(string.punctuation)}\u0964\u0965]")
+
+
+def _norm(grams: Counter) -> float:
+    """Euclidean norm of an n-gram count vector"""
+    return math.sqrt(sum(freq * freq for freq in grams.values()))
+
+
+def _words(text: str) -> Set[str]:
+    """Lowercased words of the text, without punctuation, stopwords and single letters"""
+    return {word for word in PUNCTUATION_PATTERN.sub(" ", text.lower()).split()
+            if len(word) > 1 and word not in STOPWORDS}
+
+
+def _char_ngrams(text: str, n_min: int = 2, n_max: int = 4) -> Counter:
+    """Character n-grams within word boundaries (like sklearn's char_wb)"""
+    grams = Counter()
+    for word in text.lower().split():
+        padded = f" {word} "
+        for n in range(n_min, n_max + 1):
+            for i in range(len(padded) - n + 1):
+                grams[padded[i:i + n]] += 1
+    return grams
+
+
+class IntentClassifier:
+    """Multinomial Naive Bayes over character n-grams, trained on the intent triggers and examples"""
+
+    def __init__(self, training_data: Dict[str, List[str]]):
+        self.intents = list(training_data)
+        self.vocabulary = set()
+        self.gram_counts: Dict[str, Counter] = {}
+        self.totals: Dict[str, int] = {}
+        self.phrase_vectors: Dict[str, List[Tuple[Counter, float]]] = {}
+
+        # Cue words: those found in the phrases of exactly one intent
+        word_intents = defaultdict(set)
+        for intent, phrases in training_data.items():
+            for phrase in phrases:
+                for word in _words(phrase):
+                    word_intents[word].add(intent)
+        self.cue_words: Dict[str, str] = {
+            word: next(iter(intents)) for word, intents in word_intents.items() if len(intents) == 1
+        }
+
+        for intent, phrases in training_data.items():
+            counts = Counter()
+            vectors = []
+            for phrase in phrases:
+                grams = _char_ngrams(phrase)
+                counts.update(grams)
+                vectors.append((grams, _norm(grams)))
+            self.phrase_vectors[intent] = vectors
+            self.gram_counts[intent] = counts
+            self.totals[intent] = sum(counts.values())
+            self.vocabulary.update(counts)
+
+        # Uniform prior: the seed data says nothing about real intent frequency
+        self.log_prior = -math.log(len(self.intents))
+        logger.info(f" Intent classifier trained: {len(self.intents)} intents, {len(self.vocabulary)} n-grams")
+
+    def predict_proba(self, text: str) -> List[Tuple[str, float]]:
+        """Posterior per intent, highest first"""
+        grams = _char_ngrams(text)
+        vocab_size = len(self.vocabulary)
+
+        log_scores = {}
+        for intent in self.intents:
+            counts = self.gram_counts[intent]
+            denominator = self.totals[intent] + vocab_size
+            log_scores[intent] = self.log_prior + sum(
+                freq * math.log((counts[gram] + 1) / denominator)
+                for gram, freq in grams.items()
+            )
+
+        best = max(log_scores.values())
+        exp_scores = {intent: math.exp(score - best) for intent, score in log_scores.items()}
+        total = sum(exp_scores.values())
+        return sorted(
+            ((intent, score / total) for intent, score in exp_scores.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+
+    def similarity(self, text: str, intent: str) -> float:
+        """Cosine similarity between the text and the intent's nearest training phrase"""
+        grams = _char_ngrams(text)
+        norm = _norm(grams)
+        best = 0.0
+        for phrase_grams, phrase_norm in self.phrase_vectors[intent]:
+            dot = sum(freq * phrase_grams[gram] for gram, freq in grams.items() if gram in phrase_grams)
+            best = max(best, dot / (norm * phrase_norm))
+        return best
+
+    def predict(self, text: str) -> Optional[Tuple[str, float]]:
+        """Top intent and its probability, or None when the model is unsure"""
+        if not text.strip():
+            return None
+
+        intent, probability = self.predict_proba(text)[0]
+        if probability < MIN_CONFIDENCE or self.similarity(text, intent) < MIN_SIMILARITY:
+            return None
+        # Posteriors are near 1.0 even for unrelated text, so the words must
+        # also point at this intent and no other
+        if self.cue_intents(text) != {intent}:
+            return None
+        return intent, probability
+
+    def cue_intents(self, text: str) -> Set[str]:
+        """Intents owning a cue word of the text"""
+        return {self.cue_words[word] for word in _words(text) if word in self.cue_words}
+
+
+# Every intent the prompt lists; a class missing here would have its
+# messages forced onto the nearest trained one
+intent_classifier = IntentClassifier({
+    intent: INTENT_TRIGGERS.get(intent, []) + INTENT_EXAMPLES[intent]
+    for intent in INTENT_EXAMPLES
+})
@@ -0,0 +1,45 @@
+from collections import Counter, defaultdict
+from typing import Dict, Optional
+
+
+class LLMMetrics:
+    """Process-wide token and prompt-cache counters per template, read from Gemini usage metadata
+
+    Covers every session, so it is for operators (logs), never for clients.
+    """
+
+    def __init__(self):
+        # template name -> calls, prompt_tokens, cached_tokens, output_tokens
+        self.by_template: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, template: str, response) -> Optional[Dict[str, int]]:
+        """Add one response's usage and return it; responses without usage metadata count only the call"""
+        counts = self.by_template[template]
+        counts["calls"] += 1
+        metadata = getattr(response, "usage_metadata", None)
+        if metadata is None:
+            return None
+        usage = {
+            "prompt_tokens": getattr(metadata, "prompt_token_count", 0) or 0,
+            "cached_tokens": getattr(metadata, "cached_content_token_count", 0) or 0,
+            "output_tokens": getattr(metadata, "candidates_token_count", 0) or 0,
+        }
+        counts.update(usage)
+        return usage
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Counters per template plus the share of prompt tokens served from Gemini's cache"""
+        report = {}
+        for template, counts in self.by_template.items():
+            prompt_tokens = counts["prompt_tokens"]
+            report[template] = {
+                "calls": counts["calls"],
+                "prompt_tokens": prompt_tokens,
+                "cached_tokens": counts["cached_tokens"],
+                "output_tokens": counts["output_tokens"],
+                "cache_hit_ratio": round(counts["cached_tokens"] / prompt_tokens, 3) if prompt_tokens else 0.0,
+            }
+        return report
+
+
+llm_metrics = LLMMetrics()
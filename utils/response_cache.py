@@ -0,0 +1,93 @@
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from utils.intent_clf import PUNCTUATION_PATTERN, STOPWORDS, _char_ngrams, _norm
+
+
+# Entries kept across all sessions before the least recently used is evicted
+MAX_ENTRIES = 10_000
+
+# Cosine similarity (character n-grams) needed to reuse a cached response;
+# high enough that only rephrasings of the same question match
+MIN_SIMILARITY = 0.92
+
+# Most entries scored per lookup, taken from those sharing the most index
+# words with the question; bounds the time a miss spends on the event loop
+MAX_CANDIDATES = 64
+
+class ResponseCache:
+    """Process-wide LRU of LLM responses, looked up by near-duplicate question text"""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, min_similarity: float = MIN_SIMILARITY):
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        # (namespace, normalized question) -> (n-gram vector, norm, response)
+        self.entries: OrderedDict = OrderedDict()
+        # (namespace, word) -> keys of entries containing that word, to avoid a full scan
+        self.word_index: Dict[Tuple[Hashable, str], Set[Tuple[Hashable, str]]] = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercase, drop punctuation and collapse whitespace"""
+        return " ".join(PUNCTUATION_PATTERN.sub(" ", text.lower()).split())
+
+    @staticmethod
+    def _index_words(question: str) -> Set[str]:
+        """Words of a normalized question that go into the word index"""
+        return {word for word in question.split() if word not in STOPWORDS}
+
+    def get(self, namespace: Hashable, text: str) -> Optional[str]:
+        """Cached response for the text or a close rephrasing of it, else None"""
+        question = self._normalize(text)
+        if not question:
+            # Punctuation-only input would otherwise share a single key
+            return None
+        key = (namespace, question)
+
+        if key not in self.entries:
+            grams = _char_ngrams(question)
+            norm = _norm(grams)
+            best_key, best_score = None, 0.0
+            shared = Counter()
+            for word in self._index_words(question):
+                shared.update(self.word_index.get((namespace, word), ()))
+            for candidate, _ in shared.most_common(MAX_CANDIDATES):
+                cached_grams, cached_norm, _ = self.entries[candidate]
+                dot = sum(freq * cached_grams[gram] for gram, freq in grams.items() if gram in cached_grams)
+                score = dot / (norm * cached_norm) if norm and cached_norm else 0.0
+                if score > best_score:
+                    best_key, best_score = candidate, score
+            if best_score < self.min_similarity:
+                self.misses += 1
+                return None
+            key = best_key
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return self.entries[key][2]
+
+    def put(self, namespace: Hashable, text: str, response: str):
+        """Store a response, evicting the least recently used entry when full"""
+        question = self._normalize(text)
+        if not question:
+            return
+        key = (namespace, question)
+        grams = _char_ngrams(question)
+        self.entries[key] = (grams, _norm(grams), response)
+        self.entries.move_to_end(key)
+        for word in self._index_words(question):
+            self.word_index[(namespace, word)].add(key)
+
+        if len(self.entries) > self.max_entries:
+            old_key, _ = self.entries.popitem(last=False)
+            old_namespace, old_question = old_key
+            for word in self._index_words(old_question):
+                keys = self.word_index[(old_namespace, word)]
+                keys.discard(old_key)
+                if not keys:
+                    del self.word_index[(old_namespace, word)]
+
+
+response_cache = ResponseCache()